@@ -1,8 +1,12 @@
+from functools import partial
 from textwrap import dedent
 from typing import cast
 
-from langchain_core.messages import AIMessage, HumanMessage
-from langchain_core.runnables import Runnable
+from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.prompt_values import PromptValue
+from langchain_core.prompts import MessagesPlaceholder
+from langchain_core.runnables import Runnable, RunnableLambda
 from langgraph.runtime import Runtime
 from langgraph.types import Command
 
@@ -10,6 +14,7 @@ from byte.core.event_bus import EventType, Payload
 from byte.core.logging import log
 from byte.domain.agent.nodes.base_node import Node
 from byte.domain.agent.schemas import AssistantContextSchema
+from byte.domain.agent.state import BaseState
 from byte.domain.cli.service.console_service import ConsoleService
 from byte.domain.files.service.file_service import FileService
 
@@ -22,14 +27,55 @@ class AssistantNode(Node):
 	):
 		self.goto = goto
 
-	def _create_runnable(self, context: AssistantContextSchema) -> Runnable:
+	def _apply_prompt_caching(self, prompt_value: PromptValue, static_messages: int = 1) -> list[BaseMessage]:
+		"""Mark the static prompt prefix as cacheable for Anthropic models.
+
+		Anthropic only caches prefixes that end in an explicit `cache_control`
+		breakpoint. The static prefix is the system message followed by any
+		few-shot examples, so the last of those messages is converted into a
+		structured text block carrying the breakpoint. Everything after it stays uncached.
+
+		Args:
+			prompt_value: The formatted prompt produced by the agent's template
+			static_messages: Number of leading messages that never change between turns
+
+		Returns:
+			List of messages with the last static message marked for caching
+
+		Usage: `runnable = prompt | RunnableLambda(partial(self._apply_prompt_caching, static_messages=9)) | model`
+		"""
+		messages = prompt_value.to_messages()
+
+		if static_messages < 1 or len(messages) < static_messages:
+			return messages
+
+		breakpoint_message = messages[static_messages - 1]
+		if isinstance(breakpoint_message.content, str):
+			messages[static_messages - 1] = breakpoint_message.model_copy(
+				update={
+					"content": [
+						{
+							"type": "text",
+							"text": breakpoint_message.content,
+							"cache_control": {"type": "ephemeral"},
+						}
+					]
+				}
+			)
+
+		return messages
+
+	def _create_runnable(self, context: AssistantContextSchema, static_messages: int = 1) -> Runnable:
 		"""Create the runnable chain from context configuration.
 
 		Assembles the prompt and model based on the mode (main or weak AI).
-		If tools are provided, binds them to the model with parallel execution disabled.
+		If tools are provided, binds them to the model so it may request several
+		independent tool calls per turn, which ToolNode runs concurrently.
+		Anthropic models get a prompt caching step, other providers cache prefixes automatically.
 
 		Args:
 			context: The assistant context containing prompt, models, mode, and tools
+			static_messages: Number of leading prompt messages covered by the cache breakpoint
 
 		Returns:
 			Runnable chain ready for invocation
@@ -39,15 +85,41 @@ class AssistantNode(Node):
 		# Select model based on mode
 		model = context.main if context.mode == "main" else context.weak
 
+		# Anthropic requires an explicit breakpoint to cache the static prompt prefix
+		prompt = context.prompt
+		if isinstance(model, ChatAnthropic):
+			prompt = prompt | RunnableLambda(partial(self._apply_prompt_caching, static_messages=static_messages))
+
 		# Bind tools if provided
 		if context.tools is not None and len(context.tools) > 0:
-			model = model.bind_tools(context.tools, parallel_tool_calls=False)
+			model = model.bind_tools(context.tools)
 
 		# Assemble the chain
-		runnable = context.prompt | model
+		runnable = prompt | model
 
 		return runnable
 
+	def _count_static_messages(self, state: BaseState, context: AssistantContextSchema) -> int:
+		"""Count the leading prompt messages that stay identical across turns.
+
+		The system message is always static. When the agent's prompt renders the
+		few-shot `examples` placeholder directly after it, those examples are part
+		of the static prefix as well. Examples placed anywhere else follow dynamic
+		content and are left out of the cached prefix.
+
+		Usage: `static_messages = self._count_static_messages(state, runtime.context)`
+		"""
+		prompt_messages = getattr(context.prompt, "messages", [])
+
+		if (
+			len(prompt_messages) > 1
+			and isinstance(prompt_messages[1], MessagesPlaceholder)
+			and prompt_messages[1].variable_name == "examples"
+		):
+			return 1 + len(state.get("examples", []))
+
+		return 1
+
 	async def _gather_reinforcement(self, mode: str) -> list[HumanMessage]:
 		"""Gather reinforcement messages from various domains.
 
@@ -245,7 +317,7 @@ class AssistantNode(Node):
 			state = payload.get("state", state)
 			config = payload.get("config", config)
 
-			runnable = self._create_runnable(runtime.context)
+			runnable = self._create_runnable(runtime.context, self._count_static_messages(state, runtime.context))
 
 			# TODO: This should only fire when in debug
 			# if log.opt(lazy=True).debug("Message data: {}", expensive_func)
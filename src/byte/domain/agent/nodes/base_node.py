@@ -14,6 +14,44 @@ class Node(ABC, Bootable, Eventable):
 	async def __call__(self, state: BaseState, config: RunnableConfig):
 		pass
 
+	def _extract_cache_usage(self, result: AIMessage) -> tuple[int, int]:
+		"""Extract prompt cache read and creation token counts from an AI response.
+
+		Prefers LangChain's normalized `input_token_details`, falling back to the
+		raw provider usage in `response_metadata` for Anthropic
+		(`cache_read_input_tokens` / `cache_creation_input_tokens`) and OpenAI
+		(`prompt_tokens_details.cached_tokens`).
+
+		Args:
+			result: The AI message containing usage and response metadata
+
+		Returns:
+			Tuple of (cache_read_tokens, cache_creation_tokens)
+
+		Usage: `cache_read, cache_creation = self._extract_cache_usage(result)`
+		"""
+		input_token_details = (result.usage_metadata or {}).get("input_token_details") or {}
+		if "cache_read" in input_token_details or "cache_creation" in input_token_details:
+			return input_token_details.get("cache_read", 0) or 0, input_token_details.get("cache_creation", 0) or 0
+
+		# Anthropic reports cache usage on the raw usage block
+		anthropic_usage = result.response_metadata.get("usage") or {}
+		if isinstance(anthropic_usage, dict) and (
+			"cache_read_input_tokens" in anthropic_usage or "cache_creation_input_tokens" in anthropic_usage
+		):
+			return (
+				anthropic_usage.get("cache_read_input_tokens", 0) or 0,
+				anthropic_usage.get("cache_creation_input_tokens", 0) or 0,
+			)
+
+		# OpenAI only reports cache reads, cache writes are implicit
+		openai_usage = result.response_metadata.get("token_usage") or {}
+		if not isinstance(openai_usage, dict):
+			return 0, 0
+
+		prompt_tokens_details = openai_usage.get("prompt_tokens_details") or {}
+		return prompt_tokens_details.get("cached_tokens", 0) or 0, 0
+
 	async def _track_token_usage(self, result: AIMessage, mode: str) -> None:
 		"""Track token usage from AI response and update analytics.
 
@@ -28,10 +66,13 @@ class Node(ABC, Bootable, Eventable):
 		"""
 		if result.usage_metadata:
 			usage_metadata = result.usage_metadata
+			cache_read_tokens, cache_creation_tokens = self._extract_cache_usage(result)
 			usage = TokenUsageSchema(
 				input_tokens=usage_metadata.get("input_tokens", 0),
 				output_tokens=usage_metadata.get("output_tokens", 0),
 				total_tokens=usage_metadata.get("total_tokens", 0),
+				cache_read_tokens=cache_read_tokens,
+				cache_creation_tokens=cache_creation_tokens,
 			)
 			agent_analytics_service = await self.make(AgentAnalyticsService)
 			if mode == "main":
@@ -1,9 +1,12 @@
-import json
+import asyncio
 
+import orjson
 from langchain_core.messages import ToolMessage
+from langchain_core.tools import BaseTool
 from langgraph.graph.message import RemoveMessage
 from langgraph.runtime import Runtime
 from langgraph.types import Command
+from rich.live import Live
 from rich.pretty import Pretty
 
 from byte.core.mixins.user_interactive import UserInteractive
@@ -11,10 +14,39 @@ from byte.core.utils import get_last_message
 from byte.domain.agent.nodes.base_node import Node
 from byte.domain.agent.schemas import AssistantContextSchema, ConstraintSchema
 from byte.domain.cli.rich.markdown import Markdown
+from byte.domain.cli.rich.rune_spinner import RuneSpinner
 from byte.domain.cli.service.console_service import ConsoleService
 
 
+def _dumps(obj) -> str:
+	"""Serialize tool arguments and results to a JSON string via orjson.
+
+	Usage: `content = _dumps(tool_result)`
+	"""
+	return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class ToolNode(Node, UserInteractive):
+	async def boot(self, **kwargs):
+		self._tools: list[BaseTool] | None = None
+		self._tools_by_name: dict[str, BaseTool] = {}
+
+	def _get_tools_by_name(self, tools: list[BaseTool]) -> dict[str, BaseTool]:
+		"""Return a mapping of tool names to tools, rebuilt only when the tool list changes.
+
+		The tool list on the runtime context stays the same across every turn of
+		an agent run, so the mapping is cached against the list instance. The cache
+		is keyed on list identity only, so mutating `context.tools` in place leaves
+		it stale; assign a new list instead.
+
+		Usage: `tool = self._get_tools_by_name(runtime.context.tools)["read_file"]`
+		"""
+		if tools is not self._tools:
+			self._tools = tools
+			self._tools_by_name = {tool.name: tool for tool in tools}
+
+		return self._tools_by_name
+
 	async def __call__(self, state, runtime: Runtime[AssistantContextSchema]):
 		message = get_last_message(state["messages"])
 
@@ -26,28 +58,23 @@ class ToolNode(Node, UserInteractive):
 		if not tools:
 			return Command(goto="assistant_node", update={"messages": []})
 
-		# Build a mapping of tool names to tool instances
-		tools_by_name = {tool.name: tool for tool in tools}
+		# Look up the mapping of tool names to tool instances
+		tools_by_name = self._get_tools_by_name(tools)
 
-		# dd()
+		console = await self.make(ConsoleService)
 
+		# Confirm every tool call up front, since prompting needs the terminal and must stay sequential
 		for tool_call in message.tool_calls:
-			console = await self.make(ConsoleService)
-
 			pretty = Pretty(tool_call)
 			console.print_panel(pretty)
 
 			run_tool = await self.prompt_for_confirmation(f"Use {tool_call['name']}", True)
 
-			if run_tool:
-				tool_result = await tools_by_name[tool_call["name"]].ainvoke(tool_call["args"])
-			else:
-				tool_result = {"result": "User declined tool call."}
-
+			if not run_tool:
 				# Create constraint to avoid this tool with these specific arguments
 				constraint = ConstraintSchema(
 					type="avoid",
-					description=f"Do not use {tool_call['name']} with arguments: {json.dumps(tool_call['args'])}",
+					description=f"Do not use {tool_call['name']} with arguments: {_dumps(tool_call['args'])}",
 					source="declined_tool",
 				)
 
@@ -57,6 +84,43 @@ class ToolNode(Node, UserInteractive):
 					update={"messages": [RemoveMessage(id=message.id)], "constraints": [constraint]},
 				)
 
+		total = len(message.tool_calls)
+		completed = 0
+		spinner = RuneSpinner(text=f"Running tools (0/{total})...", size=15)
+
+		async def run_tool_call(tool_call):
+			nonlocal completed
+			try:
+				tool = tools_by_name.get(tool_call["name"])
+				if tool is None:
+					raise ValueError(f"Unknown tool '{tool_call['name']}'. Available tools: {', '.join(tools_by_name)}")
+
+				return await tool.ainvoke(tool_call["args"])
+			finally:
+				completed += 1
+				spinner.text = f"Running tools ({completed}/{total})..."
+
+		# All calls were approved and are independent, so run them concurrently while showing progress
+		with Live(spinner, console=console.console, transient=True, refresh_per_second=20):
+			tool_results = await asyncio.gather(
+				*(run_tool_call(tool_call) for tool_call in message.tool_calls),
+				return_exceptions=True,
+			)
+
+		for tool_call, tool_result in zip(message.tool_calls, tool_results):
+			# A failing tool should not discard the results of the others, so report it back to the assistant
+			if isinstance(tool_result, BaseException):
+				console.print_error_panel(f"{tool_call['name']} failed: {tool_result!s}", title="Tool Error")
+				outputs.append(
+					ToolMessage(
+						content=_dumps({"error": f"{type(tool_result).__name__}: {tool_result!s}"}),
+						name=tool_call["name"],
+						tool_call_id=tool_call["id"],
+						status="error",
+					)
+				)
+				continue
+
 			# Display tool result and confirm if it should be added to response
 			result_pretty = Markdown(tool_result)
 			console.print_panel(result_pretty, title="Tool Result")
@@ -68,7 +132,7 @@ class ToolNode(Node, UserInteractive):
 
 			outputs.append(
 				ToolMessage(
-					content=json.dumps(tool_result),
+					content=_dumps(tool_result),
 					name=tool_call["name"],
 					tool_call_id=tool_call["id"],
 				)
@@ -1,3 +1,4 @@
+from dataclasses import dataclass as stdlib_dataclass
 from typing import List, Literal, Optional
 
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -7,12 +8,15 @@ from pydantic import Field
 from pydantic.dataclasses import dataclass
 
 
-@dataclass
+@stdlib_dataclass(frozen=True, slots=True)
 class ConstraintSchema:
 	"""User-defined constraint to guide agent behavior during execution.
 
 	Constraints are suggestions or actions the agent should avoid or follow based on
-	user feedback, such as declined tool calls or rejected suggestions.
+	user feedback, such as declined tool calls or rejected suggestions. Uses a plain
+	slotted stdlib dataclass rather than pydantic since constraints are only built
+	internally and accumulate in state. Fields are not validated: `type` is not
+	enforced to be "avoid" or "require" at runtime, so callers must pass a valid value.
 
 	Usage: `constraint = ConstraintSchema(type="avoid", description="Do not suggest using ripgrep_search")`
 	Usage: `constraint = ConstraintSchema(type="require", description="Always use type hints", source="user_input")`
@@ -20,7 +24,7 @@ class ConstraintSchema:
 
 	type: Literal["avoid", "require"]  # Whether this is something to avoid or something required
 	description: str  # Human-readable constraint description
-	source: Optional[str] = Field(default=None)  # Where the constraint originated (e.g., "declined_tool", "user_input")
+	source: Optional[str] = None  # Where the constraint originated (e.g., "declined_tool", "user_input")
 
 
 @dataclass
@@ -51,11 +55,16 @@ class AssistantContextSchema:
 class TokenUsageSchema:
 	"""Token usage tracking for LLM interactions.
 
-	Tracks input, output, and total tokens consumed during LLM operations.
+	Tracks input, output, and total tokens consumed during LLM operations, along
+	with how many of the input tokens were read from or written to the provider's
+	prompt cache. Cached tokens are a subset of `input_tokens`.
 
 	Usage: `usage = TokenUsageSchema(input_tokens=2897, output_tokens=229, total_tokens=3126)`
+	Usage: `usage = TokenUsageSchema(input_tokens=2897, cache_read_tokens=2048)`
 	"""
 
 	input_tokens: int = 0
 	output_tokens: int = 0
 	total_tokens: int = 0
+	cache_read_tokens: int = 0  # Input tokens served from the prompt cache
+	cache_creation_tokens: int = 0  # Input tokens written to the prompt cache
@@ -23,6 +23,8 @@ class LastMessageUsage:
 
 	input: int = 0
 	output: int = 0
+	cache_read: int = 0
+	cache_creation: int = 0
 	type: str = ""
 
 
@@ -29,16 +29,33 @@ class AgentAnalyticsService(Service):
 		self.usage.main.context = token_usage.total_tokens
 		self.usage.main.total.input += token_usage.input_tokens
 		self.usage.main.total.output += token_usage.output_tokens
-		self.usage.last.input = token_usage.input_tokens
-		self.usage.last.output = token_usage.output_tokens
-		self.usage.last.type = "main"
+		self._update_last_usage(token_usage, "main")
 
 	async def update_weak_usage(self, token_usage: TokenUsageSchema) -> None:
 		self.usage.weak.total.input += token_usage.input_tokens
 		self.usage.weak.total.output += token_usage.output_tokens
+		self._update_last_usage(token_usage, "weak")
+
+	def _update_last_usage(self, token_usage: TokenUsageSchema, model_type: str) -> None:
+		"""Record the token usage of the most recent message.
+
+		Usage: `self._update_last_usage(token_usage, "main")`
+		"""
 		self.usage.last.input = token_usage.input_tokens
 		self.usage.last.output = token_usage.output_tokens
-		self.usage.last.type = "weak"
+		self.usage.last.cache_read = token_usage.cache_read_tokens
+		self.usage.last.cache_creation = token_usage.cache_creation_tokens
+		self.usage.last.type = model_type
+
+	def cache_hit_ratio(self) -> float:
+		"""Return the share of the last message's input tokens served from the prompt cache.
+
+		Usage: `ratio = service.cache_hit_ratio()` -> 0.82
+		"""
+		if not self.usage.last.input:
+			return 0.0
+
+		return self.usage.last.cache_read / self.usage.last.input
 
 	async def usage_panel_hook(self, payload: Payload) -> Payload:
 		"""Display token usage analytics panel with progress bars.
@@ -91,6 +108,11 @@ class AgentAnalyticsService(Service):
 		last_input = self.humanizer(self.usage.last.input)
 		last_output = self.humanizer(self.usage.last.output)
 
+		# Only mention the prompt cache for providers that actually report cache usage
+		if self.usage.last.cache_read or self.usage.last.cache_creation:
+			last_cached = self.humanizer(self.usage.last.cache_read)
+			last_input = f"{last_input} ({last_cached} cached, {self.cache_hit_ratio() * 100:.0f}%)"
+
 		grid = Table.grid(expand=True)
 		grid.add_column()
 		grid.add_column(ratio=1)
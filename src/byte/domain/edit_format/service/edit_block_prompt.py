@@ -4,10 +4,7 @@ from textwrap import dedent
 edit_format_system = dedent("""
 	# *SEARCH/REPLACE block* Rules:
 
-	Use *SEARCH/REPLACE blocks* to make precise edits to files. Each block specifies:
-	- **What file** to modify (with full path)
-	- **What content** to find (SEARCH section)
-	- **What to replace** it with (REPLACE section)
+	Use *SEARCH/REPLACE blocks* to make precise edits to files.
 
 	## Block Format:
 
@@ -22,22 +19,11 @@ edit_format_system = dedent("""
 	8. Closing fence: ```
 
 	## Operation Types:
-	- `+++++++` for **editing** existing files or **creating** new files
-	- `-------` for **removing** files or **replacing entire file contents**
+	- `+++++++` edits an existing file, or creates a new file when SEARCH is empty
+	- `-------` with empty SEARCH replaces the entire file contents with REPLACE, or removes the file when REPLACE is also empty
 
-	## Examples:
+	## Example:
 
-	**Create a new file:**
-	```python
-	+++++++ mathweb/flask/app.py
-	<<<<<<< SEARCH
-	=======
-	import math
-	from flask import Flask
-	>>>>>>> REPLACE
-	```
-
-	**Edit existing file content:**
 	```python
 	+++++++ mathweb/flask/app.py
 	<<<<<<< SEARCH
@@ -48,49 +34,13 @@ edit_format_system = dedent("""
 	>>>>>>> REPLACE
 	```
 
-   **Remove entire file:**
-	```python
-	------- mathweb/flask/app.py
-	<<<<<<< SEARCH
-	=======
-	>>>>>>> REPLACE
-	```
-
-	**Replace all file contents:**
-	```python
-	------- mathweb/flask/app.py
-	<<<<<<< SEARCH
-	=======
-	import math
-	from flask import Flask
-	>>>>>>> REPLACE
-	```
-
 	## **CRITICAL RULES:**
-
-	File Paths:
-	- Use the FULL file path exactly as shown by the user
-	- No bold asterisks, quotes, or escaping around the path
-
-	Search Content:
-	- Must EXACTLY MATCH existing file content, character for character
-	- Include all comments, docstrings, whitespace, etc.
-	- If file contains wrapped/escaped content, match the literal file contents
-
-	Block Strategy:
-	- Keep blocks small and focused
-	- Use multiple blocks for multiple changes to the same file
-	- Include enough context lines to make each search unique
-	- Only replace the first occurrence found
-
-	File Operations:
+	- Use the FULL file path exactly as shown by the user, with no bold asterisks, quotes, or escaping
+	- SEARCH must EXACTLY MATCH the existing file character for character, including comments, docstrings, whitespace and any wrapped/escaped content
+	- Keep blocks small and focused; use multiple blocks for multiple changes, with just enough context for each SEARCH to be unique
+	- Only the first match of a SEARCH is replaced
 	- Only edit files that the user has added to the chat
-	- For new files: use +++++++ with empty SEARCH, content in REPLACE
-	- To move code: use 2 blocks (1 to delete, 1 to insert)
-	- To rename files: use shell commands after your response
-
-	User Intent:
-	- If user says "ok", "go ahead", or "do that" → provide SEARCH/REPLACE blocks
+	- To move code use 2 blocks (1 to delete, 1 to insert); to rename files use shell commands after your response
 	- Wait for user confirmation before assuming edits are applied
 	- ONLY EVER RETURN CODE IN A SEARCH/REPLACE BLOCK!""")
 
@@ -1,6 +1,8 @@
 import asyncio
+import shutil
+import sys
 from pathlib import Path
-from typing import AsyncGenerator, Generator
+from typing import AsyncGenerator
 
 import pytest
 import pytest_asyncio
@@ -21,26 +23,43 @@ from byte.domain.memory.service.memory_service import MemoryService
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator:
-	"""Create an instance of the default event loop for the test session.
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+	"""Provide the uvloop event loop policy for the test session where supported.
 
-	Usage: Automatically used by pytest-asyncio for async tests
+	uvloop is not available on Windows, so the default asyncio policy is used there.
+
+	Usage: Automatically used by pytest-asyncio when creating event loops
+	"""
+	if sys.platform != "win32":
+		import uvloop
+
+		return uvloop.EventLoopPolicy()
+
+	return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def git_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+	"""Initialize a single empty git repository to copy into each test project.
+
+	Usage: Used by `tmp_project_root` instead of running `git init` per test
 	"""
-	loop = asyncio.get_event_loop_policy().new_event_loop()
-	yield loop
-	loop.close()
+	import git
+
+	template_dir = tmp_path_factory.mktemp("git_template")
+	git.Repo.init(template_dir)
+
+	return template_dir / ".git"
 
 
 @pytest.fixture
-def tmp_project_root(tmp_path: Path) -> Path:
+def tmp_project_root(tmp_path: Path, git_template: Path) -> Path:
 	"""Create a temporary project root directory with git initialization.
 
 	Usage: `def test_something(tmp_project_root): ...`
 	"""
-	# Initialize a git repository in the temp directory
-	import git
-
-	git.Repo.init(tmp_path)
+	# Copy the pre-initialized git directory rather than spawning `git init` for every test
+	shutil.copytree(git_template, tmp_path / ".git")
 
 	return tmp_path
 
@@ -100,7 +119,10 @@ async def test_container(test_config: ByteConfg) -> AsyncGenerator[Container, No
 
 	yield container
 
-	# Cleanup: shutdown task manager
+	# Cleanup: shutdown task manager, only if the test actually resolved one
+	if TaskManager not in container._instances:
+		return
+
 	try:
 		task_manager = await container.make(TaskManager)
 		await task_manager.shutdown()
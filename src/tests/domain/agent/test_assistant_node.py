@@ -0,0 +1,79 @@
+"""Test suite for AssistantNode prompt caching.
+
+Tests that the Anthropic cache breakpoint is placed on the last message of
+the static prompt prefix (system message plus few-shot examples).
+"""
+
+from types import SimpleNamespace
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from byte.domain.agent.implementations.ask.prompts import ask_prompt
+from byte.domain.agent.implementations.coder.prompts import coder_prompt
+from byte.domain.agent.nodes.assistant_node import AssistantNode
+from byte.domain.edit_format.service.edit_block_prompt import edit_format_system, practice_messages
+
+
+def _coder_state() -> dict:
+	"""Build the minimal state needed to render the coder prompt."""
+	return {
+		"edit_format_system": edit_format_system,
+		"examples": practice_messages,
+		"project_inforamtion_and_context": [],
+		"file_context": "No files in context.",
+		"masked_messages": [("user", "Add a docstring to main().")],
+		"reinforcement": [],
+		"errors": [],
+	}
+
+
+def _has_cache_control(message) -> bool:
+	"""Return True if the message content carries a cache_control breakpoint."""
+	return isinstance(message.content, list) and any("cache_control" in block for block in message.content)
+
+
+class TestAssistantNodePromptCaching:
+	"""Test suite for static prefix counting and cache breakpoint placement."""
+
+	def test_breakpoint_lands_on_last_coder_example(self):
+		"""Verify the coder prompt caches the system message and every example, and nothing after."""
+		node = AssistantNode()
+		state = _coder_state()
+
+		static_messages = node._count_static_messages(state, SimpleNamespace(prompt=coder_prompt))
+		assert static_messages == 1 + len(practice_messages)
+
+		messages = node._apply_prompt_caching(coder_prompt.invoke(state), static_messages=static_messages)
+
+		breakpoints = [i for i, message in enumerate(messages) if _has_cache_control(message)]
+		assert breakpoints == [len(practice_messages)]
+
+		last_example = messages[len(practice_messages)]
+		assert last_example.type == "ai"
+		assert last_example.content[0]["text"] == practice_messages[-1][1]
+
+	def test_prompt_without_examples_caches_system_message(self):
+		"""Verify prompts without an examples placeholder only cache the system message."""
+		node = AssistantNode()
+		state = {"examples": practice_messages}
+
+		static_messages = node._count_static_messages(state, SimpleNamespace(prompt=ask_prompt))
+
+		assert static_messages == 1
+
+	def test_examples_after_dynamic_content_are_not_cached(self):
+		"""Verify examples rendered after a dynamic placeholder stay out of the cached prefix."""
+		node = AssistantNode()
+		prompt = ChatPromptTemplate.from_messages(
+			[
+				("system", "You are helpful."),
+				("placeholder", "{project_inforamtion_and_context}"),
+				("placeholder", "{examples}"),
+				("user", "{file_context}"),
+			]
+		)
+		state = {"examples": practice_messages}
+
+		static_messages = node._count_static_messages(state, SimpleNamespace(prompt=prompt))
+
+		assert static_messages == 1
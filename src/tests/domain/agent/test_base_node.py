@@ -0,0 +1,69 @@
+"""Test suite for Node token usage helpers.
+
+Tests extraction of prompt cache token counts across the response shapes
+reported by LangChain and the individual providers.
+"""
+
+from langchain_core.messages import AIMessage
+
+from byte.domain.agent.nodes.base_node import Node
+
+
+def _usage_metadata(**extra) -> dict:
+	"""Build usage metadata with the required token totals."""
+	return {"input_tokens": 1000, "output_tokens": 100, "total_tokens": 1100, **extra}
+
+
+class TestNodeExtractCacheUsage:
+	"""Test suite for _extract_cache_usage."""
+
+	def test_normalized_input_token_details(self):
+		"""Verify LangChain's normalized input_token_details is used when present."""
+		result = AIMessage(
+			content="done",
+			usage_metadata=_usage_metadata(input_token_details={"cache_read": 800, "cache_creation": 150}),
+		)
+
+		assert Node()._extract_cache_usage(result) == (800, 150)
+
+	def test_anthropic_usage(self):
+		"""Verify Anthropic's raw usage block is read when no normalized details exist."""
+		result = AIMessage(
+			content="done",
+			usage_metadata=_usage_metadata(),
+			response_metadata={
+				"usage": {
+					"input_tokens": 50,
+					"cache_read_input_tokens": 700,
+					"cache_creation_input_tokens": 250,
+				}
+			},
+		)
+
+		assert Node()._extract_cache_usage(result) == (700, 250)
+
+	def test_openai_prompt_tokens_details(self):
+		"""Verify OpenAI's cached_tokens is read as cache reads with no cache writes."""
+		result = AIMessage(
+			content="done",
+			usage_metadata=_usage_metadata(),
+			response_metadata={"token_usage": {"prompt_tokens": 1000, "prompt_tokens_details": {"cached_tokens": 640}}},
+		)
+
+		assert Node()._extract_cache_usage(result) == (640, 0)
+
+	def test_openai_prompt_tokens_details_none(self):
+		"""Verify a null prompt_tokens_details from OpenAI reports no cache usage."""
+		result = AIMessage(
+			content="done",
+			usage_metadata=_usage_metadata(),
+			response_metadata={"token_usage": {"prompt_tokens": 1000, "prompt_tokens_details": None}},
+		)
+
+		assert Node()._extract_cache_usage(result) == (0, 0)
+
+	def test_empty_response(self):
+		"""Verify a response without any usage information reports no cache usage."""
+		result = AIMessage(content="done")
+
+		assert Node()._extract_cache_usage(result) == (0, 0)
@@ -0,0 +1,157 @@
+"""Test suite for ToolNode.
+
+Tests confirmation handling, concurrent tool execution, result ordering and
+error isolation between tool calls.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.tools import tool
+from langgraph.graph.message import RemoveMessage
+
+from byte.domain.agent.nodes.tool_node import ToolNode
+from byte.domain.agent.schemas import ConstraintSchema
+
+calls: list[str] = []
+
+
+@tool
+async def slow_echo(text: str, delay: float) -> str:
+	"""Echo the text back after a delay.
+
+	Args:
+		text: The text to echo
+		delay: Seconds to wait before returning
+	"""
+	calls.append(text)
+	await asyncio.sleep(delay)
+	return text
+
+
+@tool
+async def broken_tool(text: str) -> str:
+	"""Always fail.
+
+	Args:
+		text: Ignored input
+	"""
+	calls.append(text)
+	raise RuntimeError("boom")
+
+
+def _tool_call(name: str, call_id: str, **args) -> dict:
+	"""Build a tool call dict as produced by the model."""
+	return {"name": name, "args": args, "id": call_id, "type": "tool_call"}
+
+
+def _runtime() -> SimpleNamespace:
+	"""Build a runtime whose context exposes the test tools."""
+	return SimpleNamespace(context=SimpleNamespace(tools=[slow_echo, broken_tool]))
+
+
+@pytest_asyncio.fixture
+async def tool_node(test_container) -> ToolNode:
+	"""Provide a booted ToolNode that auto-confirms every prompt."""
+	calls.clear()
+	node = ToolNode(test_container)
+	await node.ensure_booted()
+
+	async def confirm(message: str, default: bool = True) -> bool:
+		return True
+
+	node.prompt_for_confirmation = confirm
+	return node
+
+
+class TestToolNodeExecution:
+	"""Test suite for running approved tool calls."""
+
+	@pytest.mark.asyncio
+	async def test_tools_run_concurrently_and_keep_call_order(self, tool_node: ToolNode):
+		"""Verify tool calls run concurrently and results follow the order of message.tool_calls."""
+		message = AIMessage(
+			content="",
+			id="ai-1",
+			tool_calls=[
+				_tool_call("slow_echo", "call-1", text="first", delay=0.3),
+				_tool_call("slow_echo", "call-2", text="second", delay=0.25),
+			],
+		)
+
+		start = time.perf_counter()
+		command = await tool_node({"messages": [message]}, _runtime())
+		elapsed = time.perf_counter() - start
+
+		outputs = command.update["messages"]
+		assert command.goto == "assistant_node"
+		assert [m.tool_call_id for m in outputs] == ["call-1", "call-2"]
+		assert [m.content for m in outputs] == ['"first"', '"second"']
+		# Run serially these would take at least 0.55s
+		assert elapsed < 0.5
+
+	@pytest.mark.asyncio
+	async def test_failing_tool_does_not_discard_sibling_results(self, tool_node: ToolNode):
+		"""Verify a raising tool and an unknown tool become error messages while other results are kept."""
+		message = AIMessage(
+			content="",
+			id="ai-1",
+			tool_calls=[
+				_tool_call("broken_tool", "call-1", text="bad"),
+				_tool_call("slow_echo", "call-2", text="good", delay=0),
+				_tool_call("missing", "call-3"),
+			],
+		)
+
+		command = await tool_node({"messages": [message]}, _runtime())
+
+		outputs: list[ToolMessage] = command.update["messages"]
+		assert [m.tool_call_id for m in outputs] == ["call-1", "call-2", "call-3"]
+		assert [m.status for m in outputs] == ["error", "success", "error"]
+		assert "RuntimeError: boom" in outputs[0].content
+		assert outputs[1].content == '"good"'
+		assert "Unknown tool 'missing'" in outputs[2].content
+
+
+class TestToolNodeConfirmation:
+	"""Test suite for declined tool calls."""
+
+	@pytest.mark.asyncio
+	async def test_declined_call_returns_constraint_before_any_tool_runs(self, tool_node: ToolNode):
+		"""Verify declining any call removes the AI message, adds a constraint and runs no tools."""
+
+		async def decline_second(message: str, default: bool = True) -> bool:
+			return "broken_tool" not in message
+
+		tool_node.prompt_for_confirmation = decline_second
+		message = AIMessage(
+			content="",
+			id="ai-1",
+			tool_calls=[
+				_tool_call("slow_echo", "call-1", text="first", delay=0),
+				_tool_call("broken_tool", "call-2", text="bad"),
+			],
+		)
+
+		command = await tool_node({"messages": [message]}, _runtime())
+
+		assert calls == []
+		assert command.goto == "assistant_node"
+
+		removed = command.update["messages"]
+		assert len(removed) == 1
+		assert isinstance(removed[0], RemoveMessage)
+		assert removed[0].id == "ai-1"
+
+		constraints = command.update["constraints"]
+		assert constraints == [
+			ConstraintSchema(
+				type="avoid",
+				description='Do not use broken_tool with arguments: {"text":"bad"}',
+				source="declined_tool",
+			)
+		]